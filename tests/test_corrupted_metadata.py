@@ -1,4 +1,30 @@
-from wheelfile import WheelFile
+from io import BytesIO
+from zipfile import ZipFile
+
+import pytest
+
+from wheelfile import MetaData, WheelFile
+
+
+def _replace_member(buf, suffix, replace):
+    broken_buf = BytesIO()
+    with ZipFile(buf) as src, ZipFile(broken_buf, "w") as dst:
+        for zinfo in src.infolist():
+            contents = src.read(zinfo)
+            if zinfo.filename.endswith(suffix):
+                contents = replace(contents)
+            dst.writestr(zinfo, contents)
+    return broken_buf
+
+
+def _with_invalid_version(metadata):
+    return metadata.replace(b"Version: 0\n", b"Version: not a version!\n")
+
+
+def _without_tags(wheeldata):
+    return b"".join(
+        line for line in wheeldata.splitlines(True) if not line.startswith(b"Tag:")
+    )
 
 
 def test_when_metadata_is_corrupted_sets_metadata_to_none(buf):
@@ -35,3 +61,98 @@ def test_metadata_is_read_even_if_wheeldata_corrupted(buf):
 
     with WheelFile(buf, distname="_", version="0", mode="rl") as broken_wf:
         assert broken_wf.metadata is not None
+
+
+def test_when_metadata_is_not_utf8_sets_metadata_to_none(buf):
+    wf = WheelFile(buf, distname="_", version="0", mode="w")
+    wf.metadata = None
+    wf.writestr("_-0.dist-info/METADATA", b"Name: \xff\n")
+    wf.close()
+
+    with WheelFile(buf, distname="_", version="0", mode="rl") as broken_wf:
+        assert broken_wf.metadata is None
+
+
+def test_when_record_is_corrupted_sets_record_to_none(buf):
+    WheelFile(buf, distname="_", version="0", mode="w").close()
+    broken_buf = _replace_member(
+        buf, "/RECORD", lambda contents: b"too,many,columns,here\n"
+    )
+
+    with WheelFile(broken_buf, distname="_", version="0", mode="rl") as broken_wf:
+        assert broken_wf.record is None
+        assert broken_wf.metadata is not None
+
+
+def test_corrupted_metadata_can_be_replaced_before_it_is_read(buf):
+    wf = WheelFile(buf, distname="_", version="0", mode="w")
+    wf.metadata = "This is not a valid metadata"  # type: ignore
+    wf.close()
+
+    with WheelFile(buf, distname="_", version="0", mode="rl") as broken_wf:
+        new_metadata = MetaData(name="_", version="0")
+        broken_wf.metadata = new_metadata
+        assert broken_wf.metadata is new_metadata
+
+
+def test_when_metadata_version_is_invalid_sets_metadata_to_none(buf):
+    WheelFile(buf, distname="_", version="0", mode="w").close()
+    broken_buf = _replace_member(buf, "/METADATA", _with_invalid_version)
+
+    with WheelFile(broken_buf, distname="_", version="0", mode="rl") as broken_wf:
+        assert broken_wf.metadata is None
+
+
+def test_when_metadata_version_is_invalid_reading_raises(buf):
+    WheelFile(buf, distname="_", version="0", mode="w").close()
+    broken_buf = _replace_member(buf, "/METADATA", _with_invalid_version)
+
+    with pytest.raises(ValueError, match="METADATA .* corrupted"):
+        WheelFile(broken_buf, distname="_", version="0", mode="r")
+
+
+def test_when_wheeldata_has_no_tags_sets_wheeldata_to_none(buf):
+    WheelFile(buf, distname="_", version="0", mode="w").close()
+    broken_buf = _replace_member(buf, "/WHEEL", _without_tags)
+
+    with WheelFile(broken_buf, distname="_", version="0", mode="rl") as broken_wf:
+        assert broken_wf.wheeldata is None
+
+
+def test_when_wheeldata_has_no_tags_reading_raises(buf):
+    WheelFile(buf, distname="_", version="0", mode="w").close()
+    broken_buf = _replace_member(buf, "/WHEEL", _without_tags)
+
+    with pytest.raises(ValueError, match="WHEEL .* corrupted"):
+        WheelFile(broken_buf, distname="_", version="0", mode="r")
+
+
+def _patch_central_directory(buf, suffix, offset, value):
+    # Rewrites a 2-byte field of the central directory entry of the member
+    contents = bytearray(buf.getvalue())
+    entry = contents.find(b"PK\x01\x02")
+    while entry != -1:
+        name_len = int.from_bytes(contents[entry + 28 : entry + 30], "little")
+        name = bytes(contents[entry + 46 : entry + 46 + name_len])
+        if name.endswith(suffix):
+            contents[entry + offset : entry + offset + 2] = value.to_bytes(2, "little")
+        entry = contents.find(b"PK\x01\x02", entry + 46 + name_len)
+    return BytesIO(bytes(contents))
+
+
+def test_when_metadata_has_unsupported_compression_sets_metadata_to_none(buf):
+    WheelFile(buf, distname="_", version="0", mode="w").close()
+    # Compression method field
+    broken_buf = _patch_central_directory(buf, b"/METADATA", 10, 99)
+
+    with WheelFile(broken_buf, distname="_", version="0", mode="rl") as broken_wf:
+        assert broken_wf.metadata is None
+
+
+def test_when_metadata_is_encrypted_sets_metadata_to_none(buf):
+    WheelFile(buf, distname="_", version="0", mode="w").close()
+    # General purpose flags field, with the "encrypted" bit set
+    broken_buf = _patch_central_directory(buf, b"/METADATA", 8, 0x1)
+
+    with WheelFile(broken_buf, distname="_", version="0", mode="rl") as broken_wf:
+        assert broken_wf.metadata is None
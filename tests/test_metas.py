@@ -1,5 +1,8 @@
-from io import BytesIO
+import copy
+import hashlib
+from io import BytesIO, RawIOBase, TextIOWrapper
 from textwrap import dedent
+from zipfile import ZipFile
 
 import pytest
 from packaging.version import Version
@@ -57,6 +60,36 @@ class TestMetadata:
     def test_to_and_fro_str_objects_are_equal(self, metadata):
         assert metadata == MetaData.from_str(str(metadata))
 
+    @pytest.mark.parametrize("missing", ["Name", "Version"])
+    def test_from_str_without_required_field_raises(self, missing):
+        md_str = "".join(
+            f"{field}: value\n" for field in ("Name", "Version") if field != missing
+        )
+        with pytest.raises(ValueError, match=f"Missing {missing}"):
+            MetaData.from_str(md_str + "\n")
+
+    def test_from_str_accepts_crlf_and_continuation_lines(self):
+        md_str = (
+            "Metadata-Version: 2.1\r\n"
+            "Name: my-package\r\n"
+            "Version: 1.2.3\r\n"
+            "Summary: folded\r\n"
+            "  summary\r\n"
+            "Classifier: A\r\n"
+            "Classifier: B\r\n"
+            "\r\n"
+            "Description\r\n"
+        )
+        md = MetaData.from_str(md_str)
+        assert md.name == "my-package"
+        assert md.summary == "folded\r\n  summary"
+        assert md.classifiers == ["A", "B"]
+        assert md.description == "Description\r\n"
+
+    def test_version_given_as_str_is_converted(self, metadata):
+        metadata.version = "2.0"
+        assert metadata.version == Version("2.0")
+
     def test_metadata_version_is_2_1(self, metadata):
         assert metadata.metadata_version == "2.1"
 
@@ -188,6 +221,17 @@ class TestMetadata:
         fs = MetaData.from_str(str(md))
         assert fs == md
 
+    def test_full_usage_deepcopy_eqs_by_obj(self, full_usage):
+        md = MetaData(**full_usage)
+        copied = copy.deepcopy(md)
+        assert copied == md and str(copied) == str(md)
+
+    def test_deepcopy_does_not_share_lists(self, full_usage):
+        md = MetaData(**full_usage)
+        copied = copy.deepcopy(md)
+        copied.keywords.append("another")
+        assert "another" not in md.keywords
+
     def test_no_mistaken_attributes(self, metadata):
         with pytest.raises(AttributeError):
             metadata.maintainers = ""
@@ -252,6 +296,10 @@ class TestWheelData:
         ]
         assert set(wm.tags) == set(expected_tags)
 
+    def test_duplicated_tags_are_omitted(self):
+        wm = WheelData(tags=["py2.py3-none-any", "py3-none-any"])
+        assert sorted(wm.tags) == ["py2-none-any", "py3-none-any"]
+
     def test_wheel_version_is_1_0(self):
         assert WheelData().wheel_version == "1.0"
 
@@ -330,6 +378,16 @@ class TestWheelData:
     def test_from_str_eqs_by_obj(self):
         assert WheelData.from_str(str(WheelData())) == WheelData()
 
+    def test_from_str_with_unsupported_wheel_version_raises(self):
+        wd_str = str(WheelData()).replace("Wheel-Version: 1.0", "Wheel-Version: 2.0")
+        with pytest.raises(ValueError, match="Wheel-Version"):
+            WheelData.from_str(wd_str)
+
+    def test_from_str_without_tags_raises(self):
+        wd_str = "Wheel-Version: 1.0\nGenerator: x\nRoot-Is-Purelib: true\n\n"
+        with pytest.raises(ValueError, match="tag"):
+            WheelData.from_str(wd_str)
+
 
 class TestWheelRecord:
     @pytest.fixture
@@ -363,6 +421,78 @@ class TestWheelRecord:
 
         assert str(record) == expected_record
 
+    def test_files_larger_than_small_file_size_are_hashed_in_chunks(self, record):
+        record.SMALL_FILE_SIZE = 100
+        record.HASH_BUF_SIZE = 64
+        record.update("file", BytesIO(bytes(1000)))
+        expected_hash = "sha256=VBs-naoJsgv4X6Jz5cvT6AGFqk7CmOdl24d0K3ATilM"
+        assert str(record) == f"file,{expected_hash},1000\r\n"
+
+    def test_short_reads_do_not_end_hashing(self, record):
+        class ShortReadsIO(RawIOBase):
+            def __init__(self, data: bytes):
+                self._buf = BytesIO(data)
+
+            def readable(self):
+                return True
+
+            def tell(self):
+                return self._buf.tell()
+
+            def readinto(self, b):
+                data = self._buf.read(min(len(b), 1000))
+                b[: len(data)] = data
+                return len(data)
+
+        record.update("file", ShortReadsIO(bytes(5000)))
+        expected_record = WheelRecord()
+        expected_record.update("file", BytesIO(bytes(5000)))
+        assert str(record) == str(expected_record)
+
+    def test_update_from_zip_hashes_archived_file(self, record):
+        buf = BytesIO()
+        with ZipFile(buf, "w") as zf:
+            zf.writestr("file", bytes(1000))
+            record.update_from_zip(zf, "file")
+        expected_hash = "sha256=VBs-naoJsgv4X6Jz5cvT6AGFqk7CmOdl24d0K3ATilM"
+        assert str(record) == f"file,{expected_hash},1000\r\n"
+
+    def test_update_precomputed_uses_given_digest_and_size(self, record):
+        record.update_precomputed("file", hashlib.sha256(bytes(1000)).digest(), 1000)
+        expected_hash = "sha256=VBs-naoJsgv4X6Jz5cvT6AGFqk7CmOdl24d0K3ATilM"
+        assert str(record) == f"file,{expected_hash},1000\r\n"
+
+    @pytest.mark.parametrize("size", (0, 1000, WheelRecord.SMALL_FILE_SIZE + 1))
+    def test_update_from_path_matches_update(self, record, tmp_path, size):
+        path = tmp_path / "file"
+        path.write_bytes(bytes(size))
+        record.update_from_path("file", path)
+
+        expected = WheelRecord()
+        expected.update("file", BytesIO(bytes(size)))
+        assert str(record) == str(expected)
+
+    def test_update_many_adds_entries_in_given_order(self, record):
+        entries = [(f"file{i}", BytesIO(bytes(i * 1000))) for i in (3, 1, 2)]
+        record.update_many(entries)
+
+        expected = WheelRecord()
+        for arcpath, buf in entries:
+            buf.seek(0)
+            expected.update(arcpath, buf)
+        assert str(record) == str(expected)
+        assert [line.split(",")[0] for line in str(record).split()] == [
+            "file3",
+            "file1",
+            "file2",
+        ]
+
+    def test_update_many_with_directory_adds_nothing(self, record):
+        entries = [("file", BytesIO(b"")), ("dir/", BytesIO(b""))]
+        with pytest.raises(RecordContainsDirectoryError):
+            record.update_many(entries)
+        assert str(record) == ""
+
     def test_removing_file_removes_it_from_str_repr(self, record):
         buf = BytesIO(bytes(1000))
         record.update("file", buf)
@@ -390,6 +520,17 @@ class TestWheelRecord:
         wr.update("file", buf)
         assert str(WheelRecord.from_str(str(wr))) == str(wr)
 
+    def test_paths_with_special_characters_are_quoted(self, record):
+        record.update('some,"odd" path', BytesIO(bytes(1)))
+        assert str(record).startswith('"some,""odd"" path",sha256=')
+        assert 'some,"odd" path' in WheelRecord.from_str(str(record))
+
+    def test_from_file_reads_the_same_as_from_str(self, record):
+        record.update("file", BytesIO(bytes(1000)))
+        record.update("other", BytesIO(bytes(1)))
+        f = TextIOWrapper(BytesIO(str(record).encode()), "utf-8", newline="")
+        assert WheelRecord.from_file(f) == record
+
     def test_has_membership_operator_for_paths_in_the_record(self):
         wr = WheelRecord()
         wr.update("some/particular/path", BytesIO(bytes(1)))
@@ -404,11 +545,36 @@ class TestWheelRecord:
         with pytest.raises(UnsupportedHashTypeError):
             WheelRecord(hash_algo=hash_algo)
 
+    @pytest.mark.parametrize(
+        "hash_algo", ("sha224", "sha3_224", "shake_128", "shake_256")
+    )
+    def test_throw_with_weak_or_variable_length_hash(self, hash_algo):
+        with pytest.raises(UnsupportedHashTypeError):
+            WheelRecord(hash_algo=hash_algo)
+
+    @pytest.mark.parametrize("hash_algo", ("blake2b", "sha3_256", "sha512"))
+    def test_other_guaranteed_hashes_are_accepted(self, hash_algo):
+        wr = WheelRecord(hash_algo=hash_algo)
+        wr.update("file", BytesIO(bytes(1000)))
+        assert wr.hash_of("file").startswith(f"{hash_algo}=")
+
+    def test_blake3_hash_is_available_with_blake3_package(self):
+        blake3 = pytest.importorskip("blake3")
+        wr = WheelRecord(hash_algo="blake3")
+        wr.update("file", BytesIO(bytes(1000)))
+        digest = blake3.blake3(bytes(1000)).digest()
+        expected_digest = WheelRecord._hash_encoder(digest)
+        assert wr.hash_of("file") == f"blake3={expected_digest}"
+
     def test_update_throws_on_directory_entry(self):
         with pytest.raises(RecordContainsDirectoryError):
             wr = WheelRecord()
             wr.update("path/to/a/directory/", BytesIO(bytes(1)))
 
+    def test_from_str_throws_on_too_many_fields(self):
+        with pytest.raises(ValueError):
+            WheelRecord.from_str("file,sha256=whatever,0,extra\r\n")
+
     def test_from_str_throws_on_directory_entry(self):
         with pytest.raises(RecordContainsDirectoryError):
             record_str = "./,sha256=whatever,0"
@@ -11,5 +11,7 @@ def test_resolved_func(tmp_path):
     assert resolved(tmp_path) == str(tmp_path.name)
     assert resolved("dir/file") == "file"
     assert resolved("dir/../dir2/../file") == "file"
+    assert resolved("dir/") == "dir"
+    assert resolved("dir/..") == str(tmp_path.name)
 
     os.chdir(back)
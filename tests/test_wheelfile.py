@@ -1,4 +1,6 @@
+import gc
 import os
+import sys
 from functools import partial
 from io import BytesIO
 from pathlib import Path
@@ -53,15 +55,36 @@ class TestWheelFileInit:
         file_obj = open(real_path, "wb+")
         WheelFile(file_obj, "w").close()
 
-    # This one fails because refresh_record() reads from the zipfile.
-    # The only way it could work is if the record calculation is performed on
-    # the data passed directly to the method, not from the zipfile.
-    @pytest.mark.skip  # Because WheelFile.__del__ shows tb
-    @pytest.mark.xfail
     def test_target_can_be_binary_wb_file_obj(self, real_path):
         file_obj = open(real_path, "wb")
         WheelFile(file_obj, "w").close()
 
+    def test_target_can_be_unbuffered_file_obj(self, real_path):
+        file_obj = open(real_path, "wb+", buffering=0)
+        with WheelFile(file_obj, "w") as wf:
+            wf.writestr("file", "contents")
+        assert not file_obj.closed
+        file_obj.close()
+
+        with WheelFile(real_path) as wf:
+            assert wf.zipfile.read("file") == b"contents"
+
+    def test_unbuffered_file_obj_is_not_closed_when_close_fails(
+        self, real_path, monkeypatch
+    ):
+        # close() fails again in __del__. The default hook would report it, and
+        # pytest's one would keep the WheelFile alive through the traceback.
+        monkeypatch.setattr(sys, "unraisablehook", lambda unraisable: None)
+        file_obj = open(real_path, "wb+", buffering=0)
+        wf = WheelFile(file_obj, "w")
+        wf.metadata.summary = "Line\nbreak"
+        with pytest.raises(ValueError):
+            wf.close()
+        del wf
+        gc.collect()
+        assert not file_obj.closed
+        file_obj.close()
+
     def test_on_bufs_x_mode_behaves_same_as_w(self):
         f1, f2 = BytesIO(), BytesIO()
         wf1 = WheelFile(f1, "x", distname="_", version="0")
@@ -100,6 +123,10 @@ class TestWheelFileInit:
         with pytest.raises(ValueError):
             WheelFile(buf, "w", distname="!@#%^&*", version="0")
 
+    def test_if_given_distname_with_non_ascii_letters_raises_ValueError(self, buf):
+        with pytest.raises(ValueError):
+            WheelFile(buf, "w", distname="dist_\u0105", version="0")
+
     def test_wont_raise_on_distname_with_periods_and_underscores(self, buf):
         try:
             WheelFile(buf, "w", distname="_._._._", version="0")
@@ -207,6 +234,15 @@ class TestWheelFileAttributes:
         wf = WheelFile(buf, "w", distname="_", version="0", build_tag=build_tag)
         assert wf.build_tag == int(build_tag)
 
+    @pytest.mark.parametrize("build_tag", ["", "+1", " 1", "abc"])
+    def test_str_build_tag_not_starting_with_digit_raises(self, buf, build_tag):
+        with pytest.raises(ValueError):
+            WheelFile(buf, "w", distname="_", version="0", build_tag=build_tag)
+
+    def test_build_tag_of_other_type_raises(self, buf):
+        with pytest.raises(TypeError):
+            WheelFile(buf, "w", distname="_", version="0", build_tag=1.5)
+
     def test_given_language_tag_is_stored_in_language_tag_attr(self, buf):
         language_tag = "cp3"
         wf = WheelFile(buf, "w", distname="_", version="0", language_tag=language_tag)
@@ -642,6 +678,11 @@ class TestWheelFileDistDataWrite:
         with pytest.raises(ValueError):
             wf.writestr_data("section/path/", "_", "data")
 
+    def test_writestr__invalid_section_raises_VE_on_each_attempt(self, wf):
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                wf.writestr_data("section/path/", "_", "data")
+
     def test_writestr__writes_given_str_path(self, wf):
         contents = b"Contents of to write"
         filename = "file"
@@ -257,6 +257,56 @@ class TestRegularFilesCloning:
         with WheelFile.from_wheelfile(wf, buf) as cwf:
             assert cwf.zipfile.infolist()[0]._compresslevel == old_compresslevel
 
+    def test_compressed_data_is_copied_as_is(self, wf, buf):
+        wf.writestr("file", b"data" * 1000, compress_type=ZIP_DEFLATED)
+        wf.writestr_data("section", "file", b"data" * 1000, ZIP_DEFLATED)
+        old_sizes = [zinfo.compress_size for zinfo in wf.infolist()]
+
+        with WheelFile.from_wheelfile(wf, buf, distname="new", version="1") as cwf:
+            assert [zinfo.compress_size for zinfo in cwf.infolist()] == old_sizes
+            for arcname in ("file", "new-1.data/section/file"):
+                assert cwf.zipfile.read(arcname) == b"data" * 1000
+
+            # Same record as when the data is recompressed
+            with WheelFile.from_wheelfile(
+                wf, io.BytesIO(), distname="new", version="1", compression=ZIP_LZMA
+            ) as recompressed:
+                assert cwf.record == recompressed.record
+
+    def test_source_is_readable_after_recompressing(self, wf, buf):
+        wf.writestr("file1", b"data1")
+        wf.writestr("file2", b"data2")
+
+        with WheelFile.from_wheelfile(wf, buf, compression=ZIP_LZMA):
+            pass
+
+        assert wf.zipfile.read("file1") == b"data1"
+        assert wf.zipfile.read("file2") == b"data2"
+
+    @pytest.mark.parametrize("compression", [ZIP_DEFLATED, ZIP_LZMA, ZIP_STORED])
+    @pytest.mark.parametrize("window_size", [WheelFile.RECOMPRESS_WINDOW_SIZE, 1000])
+    def test_recompressing_in_parallel_gives_same_result(
+        self, wf, buf, monkeypatch, compression, window_size
+    ):
+        monkeypatch.setattr(WheelFile, "RECOMPRESS_WINDOW_SIZE", window_size)
+        for i in range(20):
+            wf.writestr(f"file{i}", os.urandom(i * 100))
+        wf.writestr("dir/", b"")
+
+        with WheelFile.from_wheelfile(
+            wf, io.BytesIO(), compression=compression
+        ) as sequential:
+            pass
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        with WheelFile.from_wheelfile(wf, buf, compression=compression) as parallel:
+            assert parallel.zipfile.read("file19") == wf.zipfile.read("file19")
+
+        def members(zf):
+            return [(zi.filename, zi.CRC, zi.compress_type) for zi in zf.infolist()]
+
+        assert members(parallel.zipfile) == members(sequential.zipfile)
+        assert parallel.record == sequential.record
+
     PRESERVED_ZIPINFO_ATTRS = [
         "date_time",
         "compress_type",
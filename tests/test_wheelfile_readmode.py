@@ -37,3 +37,23 @@ class TestWheelFileReadMode:
     def test_reads_record(self, empty_wheel):
         wf = WheelFile(empty_wheel.filename)
         assert wf.record == empty_wheel.record
+
+
+class TestWheelFileMembers:
+    @pytest.fixture
+    def wheel_path(self, tmp_path) -> str:
+        with WheelFile(tmp_path, "w", distname="_", version="0") as wf:
+            wf.writestr("package/module.py", b"contents")
+        return wf.filename
+
+    def test_namelist_omits_metadata_files(self, wheel_path):
+        with WheelFile(wheel_path) as wf:
+            assert wf.namelist() == ["package/module.py"]
+
+    def test_infolist_omits_metadata_files(self, wheel_path):
+        with WheelFile(wheel_path) as wf:
+            assert [zi.filename for zi in wf.infolist()] == ["package/module.py"]
+
+    def test_open_reads_member_contents(self, wheel_path):
+        with WheelFile(wheel_path) as wf, wf.open("package/module.py") as f:
+            assert f.read() == b"contents"
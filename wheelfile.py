@@ -35,20 +35,39 @@ Here's how to create a simple package under a specific directory path::
 """
 
 import base64
+import copy
 import csv
 import hashlib
 import io
+import mmap
 import os
+import shutil
+import stat
+import sys
+import time
 import warnings
 import zipfile
-from collections import namedtuple
-from email import message_from_string
-from email.message import EmailMessage
-from email.policy import EmailPolicy
-from inspect import signature
+import zlib
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from string import ascii_letters, digits
-from typing import IO, BinaryIO, Dict, List, Optional, Union
+from typing import (
+    IO,
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from packaging.tags import parse_tag
 from packaging.utils import canonicalize_name
@@ -56,6 +75,9 @@ from packaging.version import InvalidVersion, Version
 
 __version__ = "0.0.9"
 
+# Inside WheelFile, "zipfile" is shadowed by the property of the same name
+_ZipInfo = zipfile.ZipInfo
+
 
 # TODO: ensure that writing into `file` arcname and then into `file/not/really`
 # fails.
@@ -84,15 +106,180 @@ __version__ = "0.0.9"
 # TODO: fix usage of UnnamedDistributionError and ValueError - it is ambiguous
 
 
+# Errors that reading a corrupted METADATA, WHEEL, or RECORD may raise. The
+# parsers report malformed contents with ValueError (which includes
+# UnicodeDecodeError), anything else comes from the archive member itself.
+_DISTINFO_READ_ERRORS = (
+    zipfile.BadZipFile,
+    zlib.error,
+    EOFError,
+    # Member compressed with a method zipfile does not support
+    NotImplementedError,
+    # Encrypted member - ZipFile.open() raises it when no password is given
+    RuntimeError,
+    ValueError,
+    csv.Error,
+)
+
+
 def _slots_from_params(func):
     """List out slot names based on the names of parameters of func
 
     Usage: __slots__ = _slots_from_signature(__init__)
     """
-    funcsig = signature(func)
-    slots = list(funcsig.parameters)
-    slots.remove("self")
-    return slots
+    # Reading the code object directly is much cheaper than inspect.signature
+    code = func.__code__
+    return list(code.co_varnames[1 : code.co_argcount + code.co_kwonlyargcount])
+
+
+def _parse_rfc822(s: str) -> Tuple[List[Tuple[str, str]], str]:
+    """Split RFC-822-style text into a list of (name, value) headers & payload.
+
+    A lightweight substitute for `email.message_from_string`, sufficient for
+    parsing METADATA and WHEEL files. Follows the semantics of the `compat32`
+    email policy: continuation lines are kept in the value, and the headers end
+    either on the first empty line, or on the first line that isn't a header.
+    """
+    headers: List[Tuple[str, str]] = []
+    pos = 0
+    end = len(s)
+    while pos < end:
+        newline = s.find("\n", pos)
+        next_pos = end if newline == -1 else newline + 1
+        line = s[pos:next_pos]
+
+        if line[0] in " \t" and headers:
+            name, value = headers[-1]
+            headers[-1] = (name, value + line)
+        elif line in ("\n", "\r\n"):
+            pos = next_pos
+            break
+        else:
+            name, colon, value = line.partition(":")
+            if not colon:
+                break
+            headers.append((name, value.lstrip(" \t")))
+        pos = next_pos
+
+    headers = [(name, value.rstrip("\r\n")) for name, value in headers]
+    return headers, s[pos:]
+
+
+def _rfc822_header(name: str, value: str) -> str:
+    """Format a single RFC-822-style header line, including the newline.
+
+    Counterpart of `_parse_rfc822`. Values are written as they are, without
+    line folding.
+    """
+    if "\n" in value or "\r" in value:
+        raise ValueError(
+            f"Header values may not contain linefeed or carriage return "
+            f"characters: {name}: {repr(value)}"
+        )
+    return f"{name}: {value}\n" if value else f"{name}:\n"
+
+
+def _csv_field(value: Any) -> str:
+    """Format a single RECORD field, quoting it the way `csv.writer` would."""
+    if value is None:
+        return ""
+    value = str(value)
+    if '"' in value:
+        return '"' + value.replace('"', '""') + '"'
+    if "," in value or "\n" in value or "\r" in value:
+        return f'"{value}"'
+    return value
+
+
+class _HashingReader:
+    """Wraps a binary file object, hashing and counting all bytes read from it."""
+
+    def __init__(self, fp: IO[bytes], hasher):
+        self._fp = fp
+        self.hasher = hasher
+        self.size = 0
+
+    def read(self, n: int = -1) -> bytes:
+        data = self._fp.read(n)
+        self.hasher.update(data)
+        self.size += len(data)
+        return data
+
+
+def _zipinfo_from_stat(
+    filename: Union[str, Path],
+    arcname: Optional[str],
+    st: os.stat_result,
+    *,
+    strict_timestamps: bool = True,
+) -> zipfile.ZipInfo:
+    """Same as `ZipInfo.from_file`, but uses a stat result obtained beforehand."""
+    filename = os.fspath(filename)
+    isdir = stat.S_ISDIR(st.st_mode)
+    date_time = time.localtime(st.st_mtime)[0:6]
+    if not strict_timestamps and date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+    elif not strict_timestamps and date_time[0] > 2107:
+        date_time = (2107, 12, 31, 23, 59, 59)
+
+    if arcname is None:
+        arcname = filename
+    arcname = os.path.normpath(os.path.splitdrive(arcname)[1])
+    while arcname[0] in (os.sep, os.altsep):
+        arcname = arcname[1:]
+    if isdir:
+        arcname += "/"
+
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16  # Unix attributes
+    if isdir:
+        zinfo.file_size = 0
+        zinfo.external_attr |= 0x10  # MS-DOS directory flag
+    else:
+        zinfo.file_size = st.st_size
+    return zinfo
+
+
+def _scandir_walk(top: str) -> Iterator[Tuple[str, str, os.DirEntry]]:
+    """Walk a directory tree, yielding (directory, name, entry) triples.
+
+    Entries of each directory are yielded sorted by their names, with a slash
+    appended to the names of directories. Subdirectories are then walked in
+    alphabetical order. Symlinks to directories are yielded, but not followed.
+
+    Unlike `os.walk`, this gives access to the `os.DirEntry` objects, and so to
+    their cached `stat()` results.
+    """
+    try:
+        with os.scandir(top) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    named_entries = []
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir():
+            named_entries.append((entry.name + "/", entry))
+            if not entry.is_symlink():
+                subdirs.append((entry.name, entry))
+        else:
+            named_entries.append((entry.name, entry))
+
+    named_entries.sort(key=itemgetter(0))
+    for name, entry in named_entries:
+        yield top, name, entry
+
+    subdirs.sort(key=itemgetter(0))
+    for _, entry in subdirs:
+        yield from _scandir_walk(entry.path)
+
+
+# General purpose bit flags of zip members, see APPNOTE.TXT 4.4.4
+_ZIP_FLAG_ENCRYPTED = 0x1
+_ZIP_FLAG_LZMA_EOS = 0x2
+_ZIP_FLAG_DATA_DESCRIPTOR = 0x8
+_ZIP_FLAG_UTF8 = 0x800
 
 
 def _clone_zipinfo(zinfo: zipfile.ZipInfo, **to_replace) -> zipfile.ZipInfo:
@@ -377,7 +564,8 @@ class MetaData:
     ):
         # self.metadata_version = '2.1' by property
         self.name = name
-        self.version = Version(version) if isinstance(version, str) else version
+        # Parsed on first access - see the "version" property
+        self._version = version
 
         self.summary = summary
         self.description = description
@@ -408,7 +596,35 @@ class MetaData:
         self.provides_dists = provides_dists or []
         self.obsoletes_dists = obsoletes_dists or []
 
-    __slots__ = _slots_from_params(__init__)
+    # Slot descriptors are the fastest attribute storage available here -
+    # routing access through a dict via __getattr__/__getattribute__ was
+    # measured to be well over an order of magnitude slower on CPython 3.11.
+    _FIELDS = _slots_from_params(__init__)
+    __slots__ = ["_version" if f == "version" else f for f in _FIELDS]
+
+    # Fetches a tuple of attribute values for comparisons. Description is
+    # compared separately, see __eq__
+    _ATTRS = attrgetter(*(f for f in _FIELDS if f != "description"))
+
+    # Lowercase field name -> (attribute name, is the field multiple use)
+    _HEADER_TO_ATTR = {
+        (attr[:-1] if is_multi else attr).replace("_", "-"): (attr, is_multi)
+        for attr, is_multi in (
+            (a, a.endswith("s") and a != "keywords") for a in _FIELDS
+        )
+    }
+
+    @property
+    def version(self) -> Version:
+        # Strings are converted lazily, since parsing versions is costly and
+        # the value is often only passed around or stringified
+        if isinstance(self._version, str):
+            self._version = Version(self._version)
+        return self._version
+
+    @version.setter
+    def version(self, value: Union[str, Version]):
+        self._version = value
 
     @property
     def metadata_version(self):
@@ -416,17 +632,23 @@ class MetaData:
 
     _metadata_version = "2.1"
 
+    # The name conversions below are pure, and are called for every field on
+    # each __str__(), so their results are cached. field_is_multiple_use() also
+    # takes names from the outside, so its cache is bounded - the limit is still
+    # well above the number of fields.
     @classmethod
+    @lru_cache(maxsize=128)
     def field_is_multiple_use(cls, field_name: str) -> bool:
         field_name = field_name.lower().replace("-", "_").rstrip("s")
-        if field_name in cls.__slots__ or field_name == "keyword":
+        if field_name in cls._FIELDS or field_name == "keyword":
             return False
-        if field_name + "s" in cls.__slots__:
+        if field_name + "s" in cls._FIELDS:
             return True
         else:
             raise ValueError(f"Unknown field: {repr(field_name)}.")
 
     @classmethod
+    @lru_cache(maxsize=None)
     def _field_name(cls, attribute_name: str) -> str:
         if cls.field_is_multiple_use(attribute_name):
             attribute_name = attribute_name[:-1]
@@ -437,42 +659,56 @@ class MetaData:
         field_name = field_name.replace("-Email", "-email")
         return field_name
 
-    @classmethod
-    def _attr_name(cls, field_name: str) -> str:
-        if cls.field_is_multiple_use(field_name):
-            field_name += "s"
-        return field_name.lower().replace("-", "_")
-
     def __str__(self) -> str:
-        m = EmailMessage(EmailPolicy(max_line_length=None))
-        m.add_header("Metadata-Version", self.metadata_version)
-        for attr_name in self.__slots__:
+        lines = [_rfc822_header("Metadata-Version", self.metadata_version)]
+        description = None
+        # Bound once, instead of being looked up for each field
+        append = lines.append
+        header = _rfc822_header
+        field_name_of = self._field_name
+        is_multiple_use = self.field_is_multiple_use
+        for attr_name in self._FIELDS:
             content = getattr(self, attr_name)
             if not content:
                 continue
 
-            field_name = self._field_name(attr_name)
+            field_name = field_name_of(attr_name)
 
             if field_name == "Keywords":
                 content = ",".join(content)
             elif field_name == "Version":
                 content = str(content)
 
-            if self.field_is_multiple_use(field_name):
+            if is_multiple_use(field_name):
                 assert not isinstance(
                     content, str
                 ), f"Single string in multiple use attribute: {attr_name}"
 
                 for value in content:
-                    m.add_header(field_name, value)
+                    append(header(field_name, value))
             elif field_name == "Description":
-                m.set_payload(content)
+                description = content
             else:
                 assert isinstance(
                     content, str
                 ), f"Expected string, got {type(content)} instead: {attr_name}"
-                m.add_header(field_name, content)
-        return str(m)
+                append(header(field_name, content))
+
+        # Blank line ends the headers, the payload follows
+        lines.append("\n")
+        if description:
+            # Line endings are normalized, same as the email package does
+            lines.append(description.replace("\r\n", "\n").replace("\r", "\n"))
+        return "".join(lines)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "MetaData":
+        # Values are either immutable, or lists of strings - copying the lists
+        # is enough, and much cheaper than the generic deepcopy
+        new = self.__class__.__new__(self.__class__)
+        for slot in self.__slots__:
+            value = getattr(self, slot)
+            setattr(new, slot, value[:] if isinstance(value, list) else value)
+        return new
 
     def __eq__(self, other):
         if isinstance(other, MetaData):
@@ -483,40 +719,41 @@ class MetaData:
             # Ensure these two values compare equally in the description.
             mine = "" if self.description is None else self.description
             theirs = "" if other.description is None else other.description
-            descriptions_equal = mine == theirs
 
-            return (
-                all(
-                    getattr(self, field) == getattr(other, field)
-                    for field in self.__slots__
-                    if field != "description"
-                )
-                and descriptions_equal
-            )
+            return mine == theirs and self._ATTRS(self) == self._ATTRS(other)
         else:
             return NotImplemented
 
     @classmethod
     def from_str(cls, s: str) -> "MetaData":
-        m = message_from_string(s)
+        headers, payload = _parse_rfc822(s)
 
         # TODO: validate this when the rest of the versions are implemented
         # assert m['Metadata-Version'] == cls._metadata_version
 
-        del m["Metadata-Version"]
-
-        args = {}
-        for field_name in m.keys():
-            attr = cls._attr_name(field_name)
-            if not attr.endswith("s"):
-                args[attr] = m.get(field_name)
-            else:
-                if field_name == "Keywords":
-                    args[attr] = m.get(field_name).split(",")
-                else:
-                    args[attr] = m.get_all(field_name)
-
-        args["description"] = m.get_payload()
+        args: Dict[str, Any] = {}
+        for field_name, value in headers:
+            field_key = field_name.lower()
+            if field_key == "metadata-version":
+                continue
+            try:
+                attr, is_multiple_use = cls._HEADER_TO_ATTR[field_key]
+            except KeyError:
+                raise ValueError(f"Unknown field: {repr(field_name)}.") from None
+
+            if is_multiple_use:
+                args.setdefault(attr, []).append(value)
+            elif attr not in args:
+                args[attr] = value.split(",") if attr == "keywords" else value
+
+        args["description"] = payload
+        for required in ("name", "version"):
+            if required not in args:
+                raise ValueError(f"Missing {required.title()} field.")
+        # Parsed here rather than on first access, so that an invalid version
+        # is reported along with the rest of the malformed contents
+        if "version" in args:
+            args["version"] = Version(args["version"])
 
         return cls(**args)
 
@@ -568,19 +805,51 @@ class WheelData:
         # self.wheel_version = '1.0' by property
         self.generator = generator
         self.root_is_purelib = root_is_purelib
-        self.tags = self._extend_tags(tags if isinstance(tags, list) else [tags])
+        # Expanded on first access - see the "tags" property
+        self._tags: List[str] = []
+        self._unexpanded_tags: Optional[List[str]] = (
+            tags if isinstance(tags, list) else [tags]
+        )
         self.build = build
 
-    __slots__ = _slots_from_params(__init__)
+    _FIELDS = _slots_from_params(__init__)
+    __slots__ = ["_tags" if f == "tags" else f for f in _FIELDS] + ["_unexpanded_tags"]
+
+    # Fetches a tuple of all attribute values, used for comparisons
+    _ATTRS = attrgetter(*_FIELDS)
+
+    @property
+    def tags(self) -> List[str]:
+        if self._unexpanded_tags is not None:
+            self._tags = self._extend_tags(self._unexpanded_tags)
+            self._unexpanded_tags = None
+        return self._tags
+
+    @tags.setter
+    def tags(self, value: List[str]):
+        self._tags = value
+        self._unexpanded_tags = None
 
     @property
     def wheel_version(self) -> str:
         return "1.0"
 
+    # The same handful of tags is used over and over, so their expansions are
+    # cached instead of being parsed and stringified for each WHEEL
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _expand_tag(tag: str) -> Tuple[str, ...]:
+        return tuple(str(t) for t in parse_tag(tag))
+
     def _extend_tags(self, tags: List[str]) -> List[str]:
         extended_tags = []
+        # Duplicated tags are meaningless, and would only bloat WHEEL
+        seen = set()
         for tag in tags:
-            extended_tags.extend([str(t) for t in parse_tag(tag)])
+            for tag_str in self._expand_tag(tag):
+                if tag_str not in seen:
+                    seen.add(tag_str)
+                    extended_tags.append(tag_str)
         return extended_tags
 
     def __str__(self) -> str:
@@ -600,35 +869,52 @@ class WheelData:
             isinstance(self.build, int) or self.build is None
         ), f"'build' must be an int, got {type(self.build)} instead"
 
-        m = EmailMessage()
-        m.add_header("Wheel-Version", self.wheel_version)
-        m.add_header("Generator", self.generator)
-        m.add_header("Root-Is-Purelib", "true" if self.root_is_purelib else "false")
-        for tag in self.tags:
-            m.add_header("Tag", tag)
+        lines = [
+            _rfc822_header("Wheel-Version", self.wheel_version),
+            _rfc822_header("Generator", self.generator),
+            _rfc822_header(
+                "Root-Is-Purelib", "true" if self.root_is_purelib else "false"
+            ),
+        ]
+        lines.extend(_rfc822_header("Tag", tag) for tag in self.tags)
         if self.build is not None:
-            m.add_header("Build", str(self.build))
+            lines.append(_rfc822_header("Build", str(self.build)))
+        lines.append("\n")
 
-        return str(m)
+        return "".join(lines)
 
     @classmethod
     def from_str(cls, s: str) -> "WheelData":
-        m = message_from_string(s)
-        assert m["Wheel-Version"] == "1.0"
+        headers, _ = _parse_rfc822(s)
+        values = defaultdict(list)
+        for field_name, value in headers:
+            values[field_name.lower()].append(value)
+
+        if values["wheel-version"][:1] != ["1.0"]:
+            raise ValueError(
+                f"Unsupported Wheel-Version: {repr(values['wheel-version'][:1])}."
+            )
+        tags = values["tag"]
+        if not tags:
+            raise ValueError("WHEEL must contain at least one tag.")
         args = {
-            "generator": m.get("Generator"),
-            "root_is_purelib": bool(m.get("Root-Is-Purelib")),
-            "tags": m.get_all("Tag"),
+            "generator": values.get("generator", [None])[0],
+            "root_is_purelib": bool(values.get("root-is-purelib", [None])[0]),
+            "tags": tags,
         }
 
-        if "build" in m:
-            args["build"] = int(m.get("build"))
+        if "build" in values:
+            args["build"] = int(values["build"][0])
 
-        return cls(**args)
+        wheeldata = cls(**args)
+        # Expanded here rather than on first access, so that malformed tags are
+        # reported along with the rest of the malformed contents
+        wheeldata.tags = wheeldata._extend_tags(tags)
+        return wheeldata
 
     def __eq__(self, other):
         if isinstance(other, WheelData):
-            return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+            return self._ATTRS(self) == self._ATTRS(other)
         else:
             return NotImplemented
 
@@ -645,9 +931,12 @@ class WheelRecord:
     https://packaging.python.org/specifications/recording-installed-packages/.
     """
 
-    HASH_BUF_SIZE = 65536
+    HASH_BUF_SIZE = 1 << 20
+    # Files up to this size are hashed using a single read() call
+    SMALL_FILE_SIZE = 4 << 20
 
-    _RecordEntry = namedtuple("_RecordEntry", "path hash size")
+    # Missing trailing fields default to None, as they did with csv.DictReader
+    _RecordEntry = namedtuple("_RecordEntry", "path hash size", defaults=(None, None))
 
     def __init__(self, hash_algo: str = "sha256"):
         self._records: Dict[str, WheelRecord._RecordEntry] = {}
@@ -656,23 +945,55 @@ class WheelRecord:
 
     @property
     def hash_algo(self) -> str:
-        """Hash algorithm to use to generate RECORD file entries"""
+        """Hash algorithm to use to generate RECORD file entries
+
+        Any algorithm from `hashlib.algorithms_guaranteed` that is "sha256 or
+        better" (PEP-427) is accepted - that excludes "md5", "sha1", "sha224",
+        "sha3_224", and the variable-length "shake_128" and "shake_256".
+        "sha256" is the default and the most widely expected choice. On CPUs without SHA extensions, "blake2b" is usually
+        faster, and is still permitted by the spec.
+
+        Apart from the algorithms permitted by PEP-376 and PEP-427, "blake3"
+        can be used if the optional `blake3` package is installed. This is
+        non-standard and much faster, but installers will not accept such
+        wheels - use it only for wheels consumed by your own tooling.
+        """
         return self._hash_algo
 
     @hash_algo.setter
     def hash_algo(self, value: str):
+        if value == "blake3":
+            try:
+                import blake3
+            except ImportError:
+                raise UnsupportedHashTypeError(
+                    "'blake3' hash requires the 'blake3' package to be installed."
+                ) from None
+            self._hash_algo = value
+            self._hasher_proto = blake3.blake3()
+            return
+
         # per PEP-376
         if value not in hashlib.algorithms_guaranteed:
             raise UnsupportedHashTypeError(f"{repr(value)} is not a valid record hash.")
         # per PEP 427
         if value in ("md5", "sha1"):
             raise UnsupportedHashTypeError(f"{repr(value)} is a forbidden hash type.")
-
-        # PEP-427 says the RECORD hash must be sha256 or better.  Does that mean
-        # hashes such as sha224 are forbidden as well though not specifically
-        # called out?
+        # PEP-427 requires sha256 or better, which rules out shorter digests
+        if value in ("sha224", "sha3_224"):
+            raise UnsupportedHashTypeError(
+                f"{repr(value)} is weaker than sha256, which is the minimum."
+            )
+        # Their digest() requires a length, so they cannot be used as-is
+        if value.startswith("shake_"):
+            raise UnsupportedHashTypeError(
+                f"{repr(value)} has a variable-length digest, which is unsupported."
+            )
 
         self._hash_algo = value
+        # Resolved once here, so that _entry() does not look it up per file.
+        # Copying a pristine hasher is cheaper than constructing a new one.
+        self._hasher_proto = getattr(hashlib, value)()
 
     def hash_of(self, arcpath) -> str:
         """Return the hash of a file in the archive this RECORD describes
@@ -694,19 +1015,40 @@ class WheelRecord:
         return self._records[arcpath].hash
 
     def __str__(self) -> str:
-        buf = io.StringIO()
-        records = csv.DictWriter(buf, fieldnames=self._RecordEntry._fields)
-        for entry in self._records.values():
-            records.writerow(entry._asdict())
-        return buf.getvalue()
+        # Same output as csv.writer with the default "excel" dialect
+        q = _csv_field
+        return "".join(
+            f"{q(path)},{q(digest)},{q(size)}\r\n"
+            for path, digest, size in self._records.values()
+        )
 
     @classmethod
     def from_str(cls, s) -> "WheelRecord":
+        return cls.from_file(io.StringIO(s))
+
+    @classmethod
+    def from_file(cls, f: Iterable[str]) -> "WheelRecord":
+        """Create a record from RECORD contents read from a text file.
+
+        The file is read row by row, so the contents are never held in memory
+        as a whole.
+
+        Parameters
+        ----------
+        f
+            Text-mode file object, opened with `newline=""`, e.g.
+            `io.TextIOWrapper(zf.open(path), "utf-8", newline="")`.
+        """
         record = WheelRecord()
-        buf = io.StringIO(s)
-        reader = csv.DictReader(buf, cls._RecordEntry._fields)
-        for row in reader:
-            entry = cls._RecordEntry(**row)
+        make_entry = cls._RecordEntry
+        for row in csv.reader(f):
+            if not row:
+                continue
+            if len(row) > 3:
+                raise ValueError(
+                    f"RECORD row has more than 3 fields: {repr(','.join(row))}."
+                )
+            entry = make_entry(*row)
 
             if entry.path.endswith("/"):
                 raise RecordContainsDirectoryError(
@@ -726,8 +1068,9 @@ class WheelRecord:
             Path in the archive of the file that the entry describes.
 
         buf
-            Buffer from which the data will be read in HASH_BUF_SIZE chunks.
-            Must be fresh, i.e. seek(0)-ed.
+            Buffer from which the data will be read. Contents of up to
+            SMALL_FILE_SIZE bytes are read at once, the rest is read in
+            HASH_BUF_SIZE chunks. Must be fresh, i.e. seek(0)-ed.
 
         Raises
         ------
@@ -735,9 +1078,113 @@ class WheelRecord:
             If ``arcpath`` is a path to a directory.
         """
         assert buf.tell() == 0, f"Stale buffer given - current position: {buf.tell()}."
+        self._check_arcpath(arcpath)
+        self._records[arcpath] = self._entry(arcpath, buf)
+
+    def update_many(
+        self,
+        entries: Iterable[Tuple[str, IO[bytes]]],
+        max_workers: Optional[int] = None,
+    ):
+        """Add record entries for multiple files, hashing them in parallel.
+
+        Same as calling `update` for each of the given entries, but the
+        buffers are read and hashed in a thread pool. Hash functions release
+        the GIL while hashing, so this scales with the number of CPU cores.
+        Entries are added in the order in which they were given.
+
+        Parameters
+        ----------
+        entries
+            Pairs of archive paths and buffers, as taken by `update`. The
+            buffers must be safe to read from different threads.
+
+        max_workers
+            Maximum number of threads to use. Same as in
+            `concurrent.futures.ThreadPoolExecutor`.
+
+        Raises
+        ------
+        RecordContainsDirectoryError
+            If any of the paths is a path to a directory. No entries are
+            added then.
+        """
+        entries = list(entries)
+        for arcpath, buf in entries:
+            assert (
+                buf.tell() == 0
+            ), f"Stale buffer given - current position: {buf.tell()}."
+            self._check_arcpath(arcpath)
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            new_records = list(executor.map(lambda e: self._entry(*e), entries))
+
+        for record in new_records:
+            self._records[record.path] = record
+
+    def update_from_path(self, arcpath: str, path: Union[str, Path]):
+        """Add a record entry for a file on disk.
+
+        Files bigger than SMALL_FILE_SIZE are memory-mapped and hashed with a
+        single call, instead of being read in chunks.
+
+        Parameters
+        ----------
+        arcpath
+            Path in the archive of the file that the entry describes.
+
+        path
+            Path to the file on disk.
+
+        Raises
+        ------
+        RecordContainsDirectoryError
+            If ``arcpath`` is a path to a directory.
+        """
+        self._check_arcpath(arcpath)
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # Empty files cannot be mapped, and files that do not fit in the
+            # address space (32-bit builds) should not be
+            if not self.SMALL_FILE_SIZE < size <= sys.maxsize:
+                self._records[arcpath] = self._entry(arcpath, f)
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher = self._hasher_proto.copy()
+                hasher.update(mm)
+        hash_entry = f"{hasher.name}={self._hash_encoder(hasher.digest())}"
+        self._records[arcpath] = self._RecordEntry(arcpath, hash_entry, size)
+
+    def update_precomputed(self, arcpath: str, digest: bytes, size: int):
+        """Add a record entry for a file, using a digest calculated beforehand.
+
+        Parameters
+        ----------
+        arcpath
+            Path in the archive of the file that the entry describes.
+
+        digest
+            Digest of the file contents, calculated using the hash algorithm
+            set in hash_algo.
+
+        size
+            Size of the file, in bytes.
+
+        Raises
+        ------
+        RecordContainsDirectoryError
+            If ``arcpath`` is a path to a directory.
+        """
+        self._check_arcpath(arcpath)
+        hash_entry = f"{self.hash_algo}={self._hash_encoder(digest)}"
+        self._records[arcpath] = self._RecordEntry(arcpath, hash_entry, size)
+
+    @staticmethod
+    def _check_arcpath(arcpath: str):
         # if .dist-info/RECORD is not in a subdirectory, it is not allowed
-        assert "/" in arcpath.replace(".dist-info/RECORD", "") or not arcpath.endswith(
-            ".dist-info/RECORD"
+        # endswith() goes first, so that replace() runs only for RECORD files
+        assert not arcpath.endswith(".dist-info/RECORD") or "/" in arcpath.replace(
+            ".dist-info/RECORD", ""
         ), (
             f"Attempt to add an entry for a RECORD file to the RECORD: "
             f"{repr(arcpath)}."
@@ -748,20 +1195,46 @@ class WheelRecord:
                 f"Attempt to add an entry for a directory: {repr(arcpath)}"
             )
 
-        self._records[arcpath] = self._entry(arcpath, buf)
+    def update_from_zip(self, zf: zipfile.ZipFile, arcpath: str):
+        """Add a record entry for a file stored in a zip archive.
+
+        The file is hashed while it is being decompressed, without reading its
+        contents into memory as a whole.
+
+        Parameters
+        ----------
+        zf
+            Readable archive containing the file.
+
+        arcpath
+            Path of the file in the archive.
+
+        Raises
+        ------
+        RecordContainsDirectoryError
+            If ``arcpath`` is a path to a directory.
+        """
+        with zf.open(arcpath) as buf:
+            self.update(arcpath, buf)
 
     def remove(self, arcpath: str):
         del self._records[arcpath]
 
     def _entry(self, arcpath: str, buf: IO[bytes]) -> _RecordEntry:
-        size = 0
-        hasher = getattr(hashlib, self.hash_algo)()
-        while True:
-            data = buf.read(self.HASH_BUF_SIZE)
-            size += len(data)
-            if not data:
-                break
-            hasher.update(data)
+        hasher = self._hasher_proto.copy()
+        data = buf.read(self.SMALL_FILE_SIZE)
+        size = len(data)
+        hasher.update(data)
+        # Even a short read doesn't mean the end of the file - raw streams may
+        # return less than requested. Only an empty read does.
+        if data:
+            read, update, bufsize = buf.read, hasher.update, self.HASH_BUF_SIZE
+            while True:
+                data = read(bufsize)
+                if not data:
+                    break
+                size += len(data)
+                update(data)
         hash_entry = f"{hasher.name}={self._hash_encoder(hasher.digest())}"
         return self._RecordEntry(arcpath, hash_entry, size)
 
@@ -834,7 +1307,12 @@ def resolved(path: Union[str, Path]) -> str:
     str
         The name of the file or directory the `path` points to.
     """
-    return os.path.basename(os.path.abspath(path))
+    # An ordinary last component is never changed by path normalization, so
+    # abspath() - and with it, os.getcwd() - is needed only for the rest
+    name = os.path.basename(path)
+    if name in ("", ".", ".."):
+        name = os.path.basename(os.path.abspath(path))
+    return name
 
 
 # TODO: read
@@ -953,7 +1431,16 @@ class WheelFile:
     """
 
     VALID_DISTNAME_CHARS = set(ascii_letters + digits + "._")
-    METADATA_FILENAMES = {"WHEEL", "METADATA", "RECORD"}
+    # Deletion table for validate(): a distname is valid if nothing is left
+    # of it after translate().
+    _DISTNAME_DELETE = str.maketrans("", "", "".join(VALID_DISTNAME_CHARS))
+    METADATA_FILENAMES = frozenset(("WHEEL", "METADATA", "RECORD"))
+
+    # Size of chunks in which files are copied into the archive
+    WRITE_BUF_SIZE = 1 << 16
+    # How much data from_wheelfile() keeps in memory at most while
+    # recompressing files in parallel (not counting the file read last)
+    RECOMPRESS_WINDOW_SIZE = 16 << 20
 
     # TODO: implement lazy mode
     # TODO: in lazy mode, log reading/missing metadata errors
@@ -1201,9 +1688,14 @@ class WheelFile:
         self.mode = mode
 
         # These might be None in case a corrupted wheel is read in lazy mode
-        self.wheeldata: Optional[WheelData] = None
-        self.metadata: Optional[MetaData] = None
-        self.record: Optional[WheelRecord] = None
+        self._wheeldata: Optional[WheelData] = None
+        self._metadata: Optional[MetaData] = None
+        self._record: Optional[WheelRecord] = None
+        # Contents of the files read from the archive, parsed on first access
+        # to the corresponding property
+        self._wheeldata_bytes: Optional[bytes] = None
+        self._metadata_bytes: Optional[bytes] = None
+        self._record_bytes: Optional[bytes] = None
 
         self._strict_timestamps = strict_timestamps
 
@@ -1212,17 +1704,34 @@ class WheelFile:
 
         # TODO if value error, set build_tag to degenerated version, that
         # compares with Version in a way that makes Version the higher one.
-        build_tag = int(build_tag) if build_tag is not None else None
+        if isinstance(build_tag, str):
+            # Per PEP-427, build tag must start with a digit
+            if not "0" <= build_tag[:1] <= "9":
+                raise ValueError(
+                    f"Build tag must start with a digit: {repr(build_tag)}."
+                )
+            build_tag = int(build_tag)
+        elif build_tag is not None and not isinstance(build_tag, int):
+            raise TypeError(
+                f"'build_tag' must be an int or a string, got {type(build_tag)} "
+                f"instead."
+            )
 
-        if self._is_unnamed_or_directory(file_or_path):
-            self._require_distname_and_version(distname, version)
+        # Checked once, as for paths this needs a stat() call
+        unnamed_or_directory = self._is_unnamed_or_directory(file_or_path)
 
-        filename = self._get_filename(file_or_path)
-        self._pick_a_distname(filename, given_distname=distname)
-        self._pick_a_version(filename, given_version=version)
-        self._pick_tags(filename, build_tag, language_tag, abi_tag, platform_tag)
+        segments: Optional[List[str]]
+        if unnamed_or_directory:
+            self._require_distname_and_version(distname, version)
+            segments = None
+        else:
+            # Split once, the segments are shared by all of the _pick_* methods
+            segments = self._get_filename(file_or_path).split("-")
+        self._pick_a_distname(segments, given_distname=distname)
+        self._pick_a_version(segments, given_version=version)
+        self._pick_tags(segments, build_tag, language_tag, abi_tag, platform_tag)
 
-        if self._is_unnamed_or_directory(file_or_path):
+        if unnamed_or_directory:
             assert distname is not None and version is not None  # For Mypy
             self._generated_filename = self._generate_filename(
                 self._distname,
@@ -1232,30 +1741,44 @@ class WheelFile:
                 self._abi_tag,
                 self._platform_tag,
             )
+            # Paths to files are used as they are, without building a new Path
+            if isinstance(file_or_path, Path):
+                file_or_path /= self._generated_filename
         else:
             self._generated_filename = ""
 
-        if isinstance(file_or_path, Path):
-            file_or_path /= self._generated_filename
+        # zipfile writes each member in several small pieces, which would
+        # cost a system call each on an unbuffered stream. The buffer is
+        # detached on close(), so that the given object is never closed.
+        self._buffer: Optional[io.BufferedIOBase] = None
+        if isinstance(file_or_path, io.RawIOBase):
+            self._buffer = self._buffered(file_or_path)
+            file_or_path = self._buffer  # type: ignore
 
         # FIXME: the file is opened before validating the arguments, so this
         # litters empty and corrupted wheels if any arg is wrong.
-        self._zip = zipfile.ZipFile(
-            file_or_path,
-            mode.strip("l"),
-            compression=compression,
-            allowZip64=allowZip64,
-            compresslevel=compresslevel,
-            strict_timestamps=strict_timestamps,
-        )
+        try:
+            self._zip = zipfile.ZipFile(
+                file_or_path,
+                mode.strip("l"),
+                compression=compression,
+                allowZip64=allowZip64,
+                compresslevel=compresslevel,
+                strict_timestamps=strict_timestamps,
+            )
+        except BaseException:
+            if self._buffer is not None:
+                self._buffer.detach()
+            raise
 
-        # Used by distinfo_dirname, data_dirname, and _distinfo_path
-        self._distinfo_prefix: Optional[str] = None
+        # Set through _set_distinfo_prefix(), along with the .dist-info and
+        # .data directory paths, and the metadata arcnames.
+        self._distinfo_prefix: str
 
         if "w" in mode or "x" in mode:
             self._initialize_distinfo()
         else:
-            self._distinfo_prefix = self._find_distinfo_prefix()
+            self._set_distinfo_prefix(self._find_distinfo_prefix())
             self._read_distinfo()
 
         if "l" not in mode:
@@ -1355,10 +1878,11 @@ class WheelFile:
             Value used to construct `wf` is *not* reused for these parameters.
 
             For `compression` and `compresslevel`, if the value is not passed,
-            the values from the original archive are preserved. Internally the
-            data is copied using `ZipFile.writestr` with `ZipInfo` attributes
-            of the files preserved. If the value is passed, these normally
-            preserved attributes are substituted.
+            the values from the original archive are preserved - the
+            compressed data is copied as it is, without recompressing it. If
+            the value is passed, the data is recompressed using
+            `ZipFile.writestr`, with `ZipInfo` attributes of the files
+            preserved, except for the substituted ones.
 
         Raises
         ------
@@ -1409,31 +1933,32 @@ class WheelFile:
                 "same as the one used by the other WheelFile object."
             )
 
-        f_o_p = file_or_path  # For brevity
-        dir_path = (
-            f_o_p.resolve()
-            if isinstance(f_o_p, Path) and f_o_p.is_dir()
-            else (
-                f_o_p.parent.resolve()
-                if isinstance(f_o_p, Path)
-                else getattr(f_o_p, "name", None)
-            )
+        # Ensure we won't overwrite wf. Resolving paths costs a few syscalls,
+        # so it is done only if the new wheel would get the same name.
+        same_name = (
+            wf.distname == distname
+            and wf.version == version
+            and wf.build_tag == build_tag
+            and wf.language_tag == language_tag
+            and wf.abi_tag == abi_tag
+            and wf.platform_tag == platform_tag
         )
 
         # wf.zipfile.filename is not None only when it is writing to a file
-        both_are_files = wf.zipfile.filename is not None and dir_path is not None
-
-        if both_are_files:
-            assert wf.zipfile.filename is not None  # For MyPy
-            # Ensure we won't overwrite wf
-            wf_dir_path = Path(wf.zipfile.filename).parent.resolve()
-            if wf_dir_path == dir_path and (
-                wf.distname == distname
-                and wf.version == version
-                and wf.build_tag == build_tag
-                and wf.language_tag == language_tag
-                and wf.abi_tag == abi_tag
-                and wf.platform_tag == platform_tag
+        if same_name and wf.zipfile.filename is not None:
+            f_o_p = file_or_path  # For brevity
+            dir_path = (
+                f_o_p.resolve()
+                if isinstance(f_o_p, Path) and f_o_p.is_dir()
+                else (
+                    f_o_p.parent.resolve()
+                    if isinstance(f_o_p, Path)
+                    else getattr(f_o_p, "name", None)
+                )
+            )
+            if (
+                dir_path is not None
+                and Path(wf.zipfile.filename).parent.resolve() == dir_path
             ):
                 raise ValueError(
                     "Operation would overwrite the old wheel - "
@@ -1466,8 +1991,7 @@ class WheelFile:
         # wf.metadata = Corupted (& wheeldata, & record)
 
         if wf.metadata is not None:
-            # TODO: use copy.deepcopy instead
-            new_wf.metadata = MetaData.from_str(str(wf.metadata))
+            new_wf.metadata = copy.deepcopy(wf.metadata)
             new_wf.metadata.name = new_wf.distname
             new_wf.metadata.version = new_wf.version
 
@@ -1492,27 +2016,88 @@ class WheelFile:
             # Similar modality should be put in place for distname and version
             # of wf.metadata.
 
-        to_copy = wf.infolist()
-        for zinfo in to_copy:
-
-            data = wf.zipfile.read(zinfo)
-
-            arcname = zinfo.filename
-            arcname_head, *arcname_tail_parts = arcname.split("/")
-            arcname_tail = "/".join(arcname_tail_parts)
-            if arcname_head == wf.distinfo_dirname:
-                new_arcname = new_wf.distinfo_dirname + "/" + arcname_tail
-                zinfo = _clone_zipinfo(zinfo, filename=new_arcname)
-            elif arcname_head == wf.data_dirname:
-                new_arcname = new_wf.data_dirname + "/" + arcname_tail
-                zinfo = _clone_zipinfo(zinfo, filename=new_arcname)
-
-            new_wf.writestr(
-                zinfo,
-                data,
-                compress_type=compression,
-                compresslevel=compresslevel,
-            )
+        # Contents of .dist-info and .data directories are moved to the
+        # directories with the new names. The directories themselves may also
+        # be given without the trailing slash.
+        renamed_dirs = (
+            (wf._distinfo_dir, new_wf._distinfo_dir),
+            (wf._data_dir, new_wf._data_dir),
+        )
+
+        # Looked up once, instead of for each of the copied files
+        source = wf.zipfile
+        copy_raw = new_wf._copy_raw
+        copy_recompressed = new_wf._copy_recompressed
+        recompress = new_wf._recompress
+        write_recompressed = new_wf._write_recompressed
+
+        def write_result(future: "Future[Tuple[zipfile.ZipInfo, bytes, Any]]"):
+            write_recompressed(*future.result())
+
+        # With multiple CPUs, small files that have to be compressed are
+        # compressed in a thread pool, since zlib, bz2 and lzma release the
+        # GIL. The results are written in the original order, and only a
+        # window of them, bounded by both their count and their total size, is
+        # kept in memory at a time. Other files are copied as they come.
+        workers = min(32, os.cpu_count() or 1)
+        window_size = new_wf.RECOMPRESS_WINDOW_SIZE
+        # Writes waiting for their turn, along with the size of the data each
+        # of them holds in memory
+        pending: Deque[Tuple[int, Callable[[], None]]] = deque()
+        in_memory = 0
+        with ThreadPoolExecutor(workers) as executor:
+            to_copy = wf.infolist()
+            for zinfo in to_copy:
+                arcname = zinfo.filename
+                new_arcname = arcname
+                for old_dir, new_dir in renamed_dirs:
+                    if arcname.startswith(old_dir) or arcname == old_dir[:-1]:
+                        new_arcname = new_dir + arcname[len(old_dir) :]
+                        break
+
+                # Unless the compression is to be changed, the compressed data
+                # is copied as it is, instead of being inflated and deflated
+                # again
+                if (
+                    compresslevel is None
+                    and compression in (None, zinfo.compress_type)
+                    and not zinfo.flag_bits & _ZIP_FLAG_ENCRYPTED
+                ):
+                    pending.append((0, partial(copy_raw, source, zinfo, new_arcname)))
+                elif (
+                    workers == 1
+                    or zinfo.is_dir()
+                    or zinfo.file_size > WheelRecord.SMALL_FILE_SIZE
+                    # Storing the data involves no work worth spreading out
+                    or (compression or zinfo.compress_type) == zipfile.ZIP_STORED
+                ):
+                    copy_file = partial(
+                        copy_recompressed,
+                        source,
+                        zinfo,
+                        new_arcname,
+                        compression,
+                        compresslevel,
+                    )
+                    pending.append((0, copy_file))
+                else:
+                    future = executor.submit(
+                        recompress,
+                        source,
+                        zinfo,
+                        new_arcname,
+                        compression,
+                        compresslevel,
+                    )
+                    pending.append((zinfo.file_size, partial(write_result, future)))
+                    in_memory += zinfo.file_size
+
+                while len(pending) > 2 * workers or in_memory > window_size:
+                    size, write = pending.popleft()
+                    write()
+                    in_memory -= size
+            for _, write in pending:
+                write()
 
         return new_wf
 
@@ -1559,40 +2144,46 @@ class WheelFile:
         filename = "-".join(segments) + ".whl"
         return filename
 
-    @classmethod
-    def _get_filename(cls, file_or_path: Union[BinaryIO, Path]) -> Optional[str]:
+    @staticmethod
+    def _buffered(raw: io.RawIOBase) -> io.BufferedIOBase:
+        if raw.readable() and raw.writable() and raw.seekable():
+            return io.BufferedRandom(raw)
+        elif raw.writable():
+            return io.BufferedWriter(raw)
+        else:
+            return io.BufferedReader(raw)
+
+    @staticmethod
+    def _get_filename(file_or_path: Union[BinaryIO, Path]) -> str:
         """Return a filename from file obj or a path.
 
         If given file, the asumption is that the filename is within the value
         of its `name` attribute.
         If given a `Path`, assumes it is a path to an actual file, not a
         directory.
-        If given an unnamed object, this returns None.
+        Must not be given an unnamed object, see `_is_unnamed_or_directory`.
         """
-        if cls._is_unnamed_or_directory(file_or_path):
-            return None
-
         # TODO: test this
         # If a file object given, ensure its a filename, not a path
         if isinstance(file_or_path, Path):
             return file_or_path.name
         else:
             # File objects contain full path in ther name attribute
-            filename = Path(file_or_path.name).name
-            return filename
+            return os.path.basename(file_or_path.name)
 
     def _pick_a_distname(
-        self, filename: Optional[str], given_distname: Union[None, str]
+        self, segments: Optional[List[str]], given_distname: Union[None, str]
     ):
-        # filename == None means an unnamed object was given
-        assert filename is not None or given_distname is not None
+        # segments == None means an unnamed object was given
+        assert segments is not None or given_distname is not None
 
         if given_distname is not None:
             distname = given_distname
         else:
-            assert filename is not None  # For MyPy
-            distname = filename.split("-")[0]
+            assert segments is not None  # For MyPy
+            distname = segments[0]
             if distname == "":
+                filename = "-".join(segments)
                 raise UnnamedDistributionError(
                     f"No distname provided and the inferred filename does not "
                     f"contain a proper distname substring: {repr(filename)}."
@@ -1600,10 +2191,12 @@ class WheelFile:
         self._distname = distname
 
     def _pick_a_version(
-        self, filename: Optional[str], given_version: Union[None, str, Version]
+        self,
+        segments: Optional[List[str]],
+        given_version: Union[None, str, Version],
     ):
-        # filename == None means an unnamed object was given
-        assert filename is not None or given_version is not None
+        # segments == None means an unnamed object was given
+        assert segments is not None or given_version is not None
 
         if isinstance(given_version, Version):
             # We've got a valid object here, nothing else to do
@@ -1616,15 +2209,15 @@ class WheelFile:
                 "'version' must be either packaging.version.Version or a string"
             )
         else:
-            assert filename is not None  # For MyPy
-            name_segments = filename.split("-")
+            assert segments is not None  # For MyPy
 
-            if len(name_segments) < 2 or name_segments[1] == "":
+            if len(segments) < 2 or segments[1] == "":
+                filename = "-".join(segments)
                 raise UnnamedDistributionError(
                     f"No version provided and the inferred filename does not "
                     f"contain a version segment: {repr(filename)}."
                 )
-            version = name_segments[1]
+            version = segments[1]
 
         try:
             self._version = Version(version)
@@ -1636,26 +2229,25 @@ class WheelFile:
 
     def _pick_tags(
         self,
-        filename: Optional[str],
+        segments: Optional[List[str]],
         given_build: Optional[int],
         given_language: Optional[str],
         given_abi: Optional[str],
         given_platform: Optional[str],
     ):
-        # filename == None means an unnamed object was given
-        if filename is None:
+        # segments == None means an unnamed object was given
+        if segments is None:
             self._build_tag = given_build
             self._language_tag = given_language or "py3"
             self._abi_tag = given_abi or "none"
             self._platform_tag = given_platform or "any"
             return
 
-        if filename.endswith(".whl"):
-            filename = filename[:-4]
-
-        segments = filename.split("-")
         if not (len(segments) == 6 or len(segments) == 5):
             segments = [""] * 5
+        elif segments[-1].endswith(".whl"):
+            # ".whl" contains no dashes, so it can only end the last segment
+            segments = segments[:-1] + [segments[-1][:-4]]
 
         # TODO: test this when lazy mode is ready
         if len(segments) == 6 and given_build is None:
@@ -1679,51 +2271,121 @@ class WheelFile:
         self.metadata = MetaData(name=self.distname, version=self.version)
         self.record = WheelRecord()
 
+        name = canonicalize_name(self.distname).replace("-", "_")
+        version = str(self.version).replace("-", "_")
+        self._set_distinfo_prefix(f"{name}-{version}.")
+
+    def _set_distinfo_prefix(self, prefix: str):
+        self._distinfo_prefix = prefix
+        self._distinfo_dir = f"{prefix}dist-info/"
+        # Arcnames of the metadata files never change after this point
+        self._arc_metadata = f"{self._distinfo_dir}METADATA"
+        self._arc_wheel = f"{self._distinfo_dir}WHEEL"
+        self._arc_record = f"{self._distinfo_dir}RECORD"
+        self._metadata_arcnames = frozenset(
+            (self._arc_metadata, self._arc_wheel, self._arc_record)
+        )
+        self._data_dir = f"{prefix}data/"
+        # Section name -> path of its directory inside .data/
+        self._section_dirs: Dict[str, str] = {}
+
     # TODO: test edge cases related to bad contents
     # TODO: should "bad content" exceptions be saved for validate()?
-    # TODO: the try...excepts should use something stricter than "Exception"
     # TODO: save the exceptions in Corrupted objects after they are implemented
     def _read_distinfo(self):
-        try:
-            metadata = self.zipfile.read(self._distinfo_path("METADATA"))
-            self.metadata = MetaData.from_str(metadata.decode("utf-8"))
-        except Exception:
-            self.metadata = None
+        # The files are parsed only once they are needed, so that e.g. a large
+        # RECORD isn't parsed when only the metadata is used. See the
+        # `metadata`, `wheeldata`, and `record` properties.
+        to_read = (
+            (self._arc_metadata, "_metadata_bytes"),
+            (self._arc_wheel, "_wheeldata_bytes"),
+            (self._arc_record, "_record_bytes"),
+        )
+        for arcname, attr in to_read:
+            try:
+                setattr(self, attr, self._read_distinfo_file(arcname))
+            except _DISTINFO_READ_ERRORS:
+                setattr(self, attr, None)
 
+    @staticmethod
+    def _parse_distinfo_file(contents: bytes, parse: Callable[[str], Any]) -> Any:
         try:
-            wheeldata = self.zipfile.read(self._distinfo_path("WHEEL"))
-            self.wheeldata = WheelData.from_str(wheeldata.decode("utf-8"))
-        except Exception:
-            self.wheeldata = None
+            return parse(contents.decode("utf-8"))
+        except _DISTINFO_READ_ERRORS:
+            return None
 
-        try:
-            record = self.zipfile.read(self._distinfo_path("RECORD"))
-            self.record = WheelRecord.from_str(record.decode("utf-8"))
-        except Exception:
-            self.record = None
+    def _read_distinfo_file(self, arcname: str) -> Optional[bytes]:
+        zinfo = self._zip.NameToInfo.get(arcname)
+        if zinfo is None:
+            return None
+        # Knowing the size up front lets ZipExtFile.read() allocate the result
+        # at once
+        with self._zip.open(zinfo) as f:
+            return f.read(zinfo.file_size)
 
     # TODO: check what are the common bugs with wheels and implement checks here
     # TODO: test behavior if no candidates found
     def _find_distinfo_prefix(self):
-        # TODO: this could use a walrus
-        candidates = {path.split("/")[0] for path in self.zipfile.namelist()}
-        candidates = {name for name in candidates if name.endswith(".dist-info")}
-        # TODO: log them onto debug
-        if len(candidates) > 1:
-            raise BadWheelFileError(
-                "Multiple .dist-info directories found in the archive."
-            )
-        if len(candidates) == 0:
+        distinfo_dirname = None
+        # Iterating NameToInfo directly avoids building a list via namelist()
+        for path in self._zip.NameToInfo:
+            head = path.partition("/")[0]
+            if head == distinfo_dirname or not head.endswith(".dist-info"):
+                continue
+            # TODO: log them onto debug
+            if distinfo_dirname is not None:
+                raise BadWheelFileError(
+                    "Multiple .dist-info directories found in the archive."
+                )
+            distinfo_dirname = head
+
+        if distinfo_dirname is None:
             raise BadWheelFileError(
                 "Archive does not contain any .dist-info directory."
             )
 
-        return candidates.pop()[: -len("dist-info")]
+        return distinfo_dirname[: -len("dist-info")]
 
     @property
     def filename(self) -> str:
         return self._zip.filename or self._generated_filename
 
+    @property
+    def metadata(self) -> Optional[MetaData]:
+        if self._metadata_bytes is not None:
+            contents, self._metadata_bytes = self._metadata_bytes, None
+            self._metadata = self._parse_distinfo_file(contents, MetaData.from_str)
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Optional[MetaData]):
+        self._metadata_bytes = None
+        self._metadata = value
+
+    @property
+    def wheeldata(self) -> Optional[WheelData]:
+        if self._wheeldata_bytes is not None:
+            contents, self._wheeldata_bytes = self._wheeldata_bytes, None
+            self._wheeldata = self._parse_distinfo_file(contents, WheelData.from_str)
+        return self._wheeldata
+
+    @wheeldata.setter
+    def wheeldata(self, value: Optional[WheelData]):
+        self._wheeldata_bytes = None
+        self._wheeldata = value
+
+    @property
+    def record(self) -> Optional[WheelRecord]:
+        if self._record_bytes is not None:
+            contents, self._record_bytes = self._record_bytes, None
+            self._record = self._parse_distinfo_file(contents, WheelRecord.from_str)
+        return self._record
+
+    @record.setter
+    def record(self, value: Optional[WheelRecord]):
+        self._record_bytes = None
+        self._record = value
+
     @property
     def distname(self) -> str:
         return self._distname
@@ -1750,11 +2412,11 @@ class WheelFile:
 
     @property
     def distinfo_dirname(self):
-        return self._distinfo_path("", kind="dist-info")[:-1]
+        return self._distinfo_dir[:-1]
 
     @property
     def data_dirname(self):
-        return self._distinfo_path("", kind="data")[:-1]
+        return self._data_dir[:-1]
 
     # TODO: the baseline for this should be "is the wheel installable"?
     # TODO: validate naming conventions, metadata, etc.
@@ -1780,8 +2442,7 @@ class WheelFile:
         if self.distname == "":
             raise ValueError("Distname cannot be an empty string.")
 
-        distname_valid = set(self.distname) <= self.VALID_DISTNAME_CHARS
-        if not distname_valid:
+        if self.distname.translate(self._DISTNAME_DELETE):
             raise ValueError(
                 f"Invalid distname: {repr(self.distname)}. Distnames should "
                 f"contain only ASCII letters, numbers, underscores, and "
@@ -1838,7 +2499,6 @@ class WheelFile:
     # TODO: if arcname is None, refresh everything (incl. deleted files)
     # TODO: docstring - mention that this does not write record to archive and
     # that the record itself is optional
-    # FIXME: this makes basic wheel creation impossible on files with 'wb' mode
     def refresh_record(self, arcname: Union[Path, str]):
         # RECORD file is optional
         if self.record is None:
@@ -1857,15 +2517,22 @@ class WheelFile:
             "The zipfile stream must be readable in order to generate a record "
             "entry."
         )
-        with self._zip.open(arcname) as zf:
-            self.record.update(arcname, zf)
+        self.record.update_from_zip(self._zip, arcname)
 
-    def _distinfo_path(self, filename: str, *, kind="dist-info") -> str:
-        if self._distinfo_prefix is None:
-            name = canonicalize_name(self.distname).replace("-", "_")
-            version = str(self.version).replace("-", "_")
-            self._distinfo_prefix = f"{name}-{version}."
+    def _section_dir(self, section: str) -> str:
+        # Only valid sections get cached, so each is checked only once
+        try:
+            return self._section_dirs[section]
+        except KeyError:
+            self._check_section(section)
+            section_dir = self._section_dirs[section] = f"{self._data_dir}{section}/"
+            return section_dir
 
+    def _distinfo_path(self, filename: str, *, kind="dist-info") -> str:
+        if kind == "dist-info":
+            return self._distinfo_dir + filename
+        if kind == "data":
+            return self._data_dir + filename
         return f"{self._distinfo_prefix}{kind}/{filename}"
 
     # TODO: lazy mode - do not write anything in lazy mode
@@ -1892,18 +2559,24 @@ class WheelFile:
         if self.closed:
             return
 
-        if "r" not in self.mode:
-            if self.metadata is not None:
-                self.writestr(
-                    self._distinfo_path("METADATA"), str(self.metadata).encode()
-                )
-            if self.wheeldata is not None:
-                self.writestr(
-                    self._distinfo_path("WHEEL"), str(self.wheeldata).encode()
-                )
-            self._zip.writestr(self._distinfo_path("RECORD"), str(self.record).encode())
-
-        self._zip.close()
+        try:
+            if "r" not in self.mode:
+                if self.metadata is not None:
+                    metadata = str(self.metadata).encode()
+                    self._writestr(self._arc_metadata, self._arc_metadata, metadata)
+                if self.wheeldata is not None:
+                    wheeldata = str(self.wheeldata).encode()
+                    self._writestr(self._arc_wheel, self._arc_wheel, wheeldata)
+                self._zip.writestr(self._arc_record, str(self.record).encode())
+
+            self._zip.close()
+        finally:
+            # Flushes the buffer, without closing the underlying stream. This has
+            # to happen even if writing failed, otherwise the buffer would close
+            # the stream once it is garbage collected.
+            if self._buffer is not None:
+                buffer, self._buffer = self._buffer, None
+                buffer.detach()
 
     def __del__(self):
         try:
@@ -1924,7 +2597,6 @@ class WheelFile:
         return self._zip.fp is None
 
     # TODO: symlinks?
-    # TODO: use shutil.copyfileobj same way ZipFile.write does
     def write(
         self,
         filename: Union[str, Path],
@@ -1954,6 +2626,10 @@ class WheelFile:
             Same as in `zipfile.ZipFile.write`. Overrides the `compression`
             parameter given to `__init__`.
 
+            Use `zipfile.ZIP_STORED` for files that are already compressed
+            (images, nested archives, etc.) - deflating them again takes time
+            and gains next to nothing.
+
         compresslevel
             Same as in `zipfile.ZipFile.write`. Overrides the `compresslevel`
             parameter given to `__init__`.
@@ -1984,29 +2660,41 @@ class WheelFile:
         """
         if resolve and arcname is None:
             arcname = resolved(filename)
-        self._write_to_zip(filename, arcname, skipdir, compress_type, compresslevel)
+        st = os.stat(filename)
+        self._write_to_zip(filename, arcname, skipdir, compress_type, compresslevel, st)
 
-        if recursive:
+        if recursive and stat.S_ISDIR(st.st_mode):
             common_root = str(filename)
-            root_arcname = arcname
-            for root, dirs, files in os.walk(filename):
-                # For reproducibility, sort directories, so that os.walk
-                # traverses them in a defined order.
-                dirs.sort()
-
-                dirs = [d + "/" for d in dirs]
-                for name in sorted(dirs + files):
-                    filepath = os.path.join(root, name)
-                    arcpath = self._os_walk_path_to_arcpath(
-                        common_root, root, name, root_arcname
-                    )
-                    self._write_to_zip(
-                        filepath, arcpath, skipdir, compress_type, compresslevel
-                    )
+            base_arcname = arcname if arcname is not None else common_root
+            # Ensure that os.path.join will not get an absolute path after
+            # cutting 'prefix' out of a directory path.
+            # Otherwise cutting out 'prefix' might've left out leading '/',
+            # which would make os.path.join below ignore 'base_arcname'.
+            prefix = common_root.rstrip(os.sep) + os.sep
+            root_arcdir = base_arcname
+            last_root = None
+            # For reproducibility, the tree is traversed in a sorted order
+            for root, name, entry in _scandir_walk(common_root):
+                # Entries come grouped by their directory, join it once for each
+                if root is not last_root:
+                    root_arcdir = os.path.join(base_arcname, root[len(prefix) :])
+                    last_root = root
+                self._write_to_zip(
+                    entry.path,
+                    os.path.join(root_arcdir, name),
+                    skipdir,
+                    compress_type,
+                    compresslevel,
+                    entry.stat(),
+                )
 
-    def _write_to_zip(self, filename, arcname, skipdir, compress_type, compresslevel):
-        zinfo = zipfile.ZipInfo.from_file(
-            filename, arcname, strict_timestamps=self._strict_timestamps
+    def _write_to_zip(
+        self, filename, arcname, skipdir, compress_type, compresslevel, st
+    ):
+        # The stat result is taken by the caller, so that the file is not
+        # stat-ed again here
+        zinfo = _zipinfo_from_stat(
+            filename, arcname, st, strict_timestamps=self._strict_timestamps
         )
 
         # Since we construct ZipInfo manually here, we have to propagate
@@ -2016,32 +2704,25 @@ class WheelFile:
         if compresslevel is None:
             compresslevel = self.zipfile.compresslevel
 
-        if zinfo.is_dir():
+        if stat.S_ISDIR(st.st_mode):
             if skipdir:
                 return
-            else:
-                data = b""
+            self._zip.writestr(zinfo, b"", compress_type, compresslevel)
         else:
-            with open(filename, "br") as f:
-                data = f.read()
-        self._zip.writestr(zinfo, data, compress_type, compresslevel)
-        self.refresh_record(zinfo.filename)
-
-    @staticmethod
-    def _os_walk_path_to_arcpath(
-        prefix: str, directory: str, stem: str, arcname: Optional[str]
-    ):
-        if arcname is None:
-            arcname = prefix
-
-        # Ensure that os.path.join will not get an absolute path after cutting
-        # 'prefix' out of 'directory'.
-        # Otherwise cutting out 'prefix' might've left out leading '/', which
-        # would make os.path.join below ignore 'arcname'.
-        prefix = prefix.rstrip(os.sep) + os.sep
-
-        path = os.path.join(arcname, directory[len(prefix) :], stem)
-        return path
+            zinfo.compress_type = compress_type
+            zinfo._compresslevel = compresslevel
+            # Stream the contents, so that large files aren't kept in memory.
+            # The record entry is calculated on the way, so that the file does
+            # not have to be read back from the archive.
+            with open(filename, "br") as f, self._zip.open(zinfo, "w") as dst:
+                if self.record is None:
+                    shutil.copyfileobj(f, dst, self.WRITE_BUF_SIZE)
+                    return
+                src = _HashingReader(f, self.record._hasher_proto.copy())
+                shutil.copyfileobj(src, dst, self.WRITE_BUF_SIZE)
+            self.record.update_precomputed(
+                zinfo.filename, src.hasher.digest(), src.size
+            )
 
     def writestr(
         self,
@@ -2085,9 +2766,196 @@ class WheelFile:
             if isinstance(zinfo_or_arcname, zipfile.ZipInfo)
             else zinfo_or_arcname
         )
+        self._writestr(zinfo_or_arcname, arcname, data, compress_type, compresslevel)
+
+    def _writestr(
+        self,
+        zinfo_or_arcname: Union[zipfile.ZipInfo, str],
+        arcname: str,
+        data: Union[bytes, str],
+        compress_type: Optional[int] = None,
+        compresslevel: Optional[int] = None,
+    ) -> None:
+        # Same as writestr(), for callers that already know the arcname
+        if isinstance(data, str):
+            data = data.encode("utf-8")
 
         self._zip.writestr(zinfo_or_arcname, data, compress_type, compresslevel)
-        self.refresh_record(arcname)
+
+        # Hash the data in-process, instead of reading it back from the archive
+        if self.record is not None and not arcname.endswith("/"):
+            hasher = self.record._hasher_proto.copy()
+            hasher.update(data)
+            self.record.update_precomputed(arcname, hasher.digest(), len(data))
+
+    def _copy_raw(
+        self, source: zipfile.ZipFile, zinfo: zipfile.ZipInfo, arcname: str
+    ) -> None:
+        # Copies a member of another archive under a new name, without
+        # recompressing it. The data is inflated only to hash it for the
+        # record, which is much cheaper than deflating it, and checks its CRC
+        # on the way.
+        if self.record is not None and not arcname.endswith("/"):
+            with source.open(zinfo) as buf:
+                self.record.update(arcname, buf)
+
+        new_zinfo = _clone_zipinfo(zinfo, filename=arcname)
+        new_zinfo.CRC = zinfo.CRC
+        new_zinfo.compress_size = zinfo.compress_size
+        new_zinfo.file_size = zinfo.file_size
+        # Sizes are known up front, so no data descriptor is needed. The UTF-8
+        # flag is set by FileHeader(), depending on the new name.
+        new_zinfo.flag_bits = zinfo.flag_bits & ~(
+            _ZIP_FLAG_DATA_DESCRIPTOR | _ZIP_FLAG_UTF8
+        )
+
+        def read_raw(raw) -> Iterator[bytes]:
+            remaining = zinfo.compress_size
+            while remaining:
+                chunk = raw.read(min(remaining, WheelRecord.HASH_BUF_SIZE))
+                if not chunk:
+                    raise zipfile.BadZipFile(
+                        f"Truncated data of {repr(zinfo.filename)} in the source "
+                        f"archive."
+                    )
+                remaining -= len(chunk)
+                yield chunk
+
+        # The handle is positioned right at the compressed data, right after
+        # the local header of the source member. ZipExtFile has no public API
+        # for reading that data, hence the private _fileobj.
+        with source.open(zinfo) as src:
+            raw = src._fileobj  # type: ignore[attr-defined]
+            self._write_compressed(new_zinfo, read_raw(raw))
+
+    def _write_compressed(
+        self, zinfo: zipfile.ZipInfo, chunks: Iterable[bytes]
+    ) -> None:
+        # Writes a member with already compressed data. CRC and sizes must be
+        # set in zinfo. ZipFile has no public API for this, what follows
+        # mirrors what ZipFile.open(..., "w") and its handle do.
+        zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+        zf = self._zip
+        with zf._lock:
+            if zf._writing:
+                raise ValueError(
+                    "Can't write to the ZIP file while there is an open "
+                    "writing handle on it. Close the first handle before "
+                    "writing another one."
+                )
+            if zip64 and not zf._allowZip64:
+                raise zipfile.LargeZipFile("Filesize would require ZIP64 extensions")
+            zf._writecheck(zinfo)
+            if zf._seekable:
+                zf.fp.seek(zf.start_dir)
+            zinfo.header_offset = zf.fp.tell()
+            zf._didModify = True
+            zf.fp.write(zinfo.FileHeader(zip64))
+            for chunk in chunks:
+                zf.fp.write(chunk)
+
+            zf.filelist.append(zinfo)
+            zf.NameToInfo[zinfo.filename] = zinfo
+            zf.start_dir = zf.fp.tell()
+
+    @staticmethod
+    def _clone_for_recompression(
+        zinfo: zipfile.ZipInfo,
+        arcname: str,
+        compress_type: Optional[int],
+        compresslevel: Optional[int],
+    ) -> zipfile.ZipInfo:
+        new_zinfo = _clone_zipinfo(zinfo, filename=arcname)
+        if compress_type is not None:
+            new_zinfo.compress_type = compress_type
+        if compresslevel is not None:
+            new_zinfo._compresslevel = compresslevel  # type: ignore[attr-defined]
+        return new_zinfo
+
+    def _copy_recompressed(
+        self,
+        source: zipfile.ZipFile,
+        zinfo: zipfile.ZipInfo,
+        arcname: str,
+        compress_type: Optional[int],
+        compresslevel: Optional[int],
+    ) -> None:
+        # Copies a member of another archive under a new name, compressing it
+        # again. Same as writestr() with a clone of zinfo, but the data is
+        # streamed, so that large files aren't kept in memory.
+        new_zinfo = self._clone_for_recompression(
+            zinfo, arcname, compress_type, compresslevel
+        )
+
+        if new_zinfo.is_dir():
+            self._zip.writestr(new_zinfo, b"")
+            return
+
+        # Lets ZipFile decide up front whether ZIP64 extensions are needed
+        new_zinfo.file_size = zinfo.file_size
+        with source.open(zinfo) as f, self._zip.open(new_zinfo, "w") as dst:
+            if self.record is None:
+                shutil.copyfileobj(f, dst, self.WRITE_BUF_SIZE)
+                return
+            src = _HashingReader(f, self.record._hasher_proto.copy())
+            shutil.copyfileobj(src, dst, self.WRITE_BUF_SIZE)
+        self.record.update_precomputed(arcname, src.hasher.digest(), src.size)
+
+    def _recompress(
+        self,
+        source: zipfile.ZipFile,
+        zinfo: zipfile.ZipInfo,
+        arcname: str,
+        compress_type: Optional[int],
+        compresslevel: Optional[int],
+    ) -> Tuple[zipfile.ZipInfo, bytes, Optional[bytes]]:
+        # Same as _copy_recompressed(), but the data is compressed into memory
+        # instead of being written. Safe to run in worker threads - the result
+        # is written by _write_recompressed(), in the main one.
+        new_zinfo = self._clone_for_recompression(
+            zinfo, arcname, compress_type, compresslevel
+        )
+        # Same defaults as ZipFile.open(..., "w") sets
+        if new_zinfo.compress_type == zipfile.ZIP_LZMA:
+            new_zinfo.flag_bits |= _ZIP_FLAG_LZMA_EOS
+        if not new_zinfo.external_attr:
+            new_zinfo.external_attr = 0o600 << 16
+
+        compressor = zipfile._get_compressor(  # type: ignore[attr-defined]
+            new_zinfo.compress_type,
+            new_zinfo._compresslevel,  # type: ignore[attr-defined]
+        )
+        record = self.record
+        hasher = record._hasher_proto.copy() if record is not None else None
+        crc = size = 0
+        chunks = []
+        with source.open(zinfo) as f:
+            while True:
+                data = f.read(self.WRITE_BUF_SIZE)
+                if not data:
+                    break
+                crc = zlib.crc32(data, crc)
+                size += len(data)
+                if hasher is not None:
+                    hasher.update(data)
+                chunks.append(compressor.compress(data) if compressor else data)
+        if compressor:
+            chunks.append(compressor.flush())
+
+        compressed = b"".join(chunks)
+        new_zinfo.CRC = crc
+        new_zinfo.file_size = size
+        new_zinfo.compress_size = len(compressed)
+        return new_zinfo, compressed, hasher.digest() if hasher is not None else None
+
+    def _write_recompressed(
+        self, new_zinfo: zipfile.ZipInfo, compressed: bytes, digest: Optional[bytes]
+    ) -> None:
+        self._write_compressed(new_zinfo, (compressed,))
+        if self.record is not None and digest is not None:
+            self.record.update_precomputed(
+                new_zinfo.filename, digest, new_zinfo.file_size
+            )
 
     # TODO: drive letter should be stripped from the arcname the same way
     # ZipInfo.from_file does it
@@ -2159,14 +3027,19 @@ class WheelFile:
             in the archive. Set to `True` by default, which means that
             attempting to write an empty directory will be silently omitted.
         """
-        self._check_section(section)
+        section_dir = self._section_dir(section)
 
-        if isinstance(filename, str):
-            filename = Path(filename)
         if arcname is None:
-            arcname = filename.name
+            if isinstance(filename, Path):
+                arcname = filename.name
+            else:
+                arcname = os.path.basename(filename)
+                # Trailing separators and "." need the normalization pathlib
+                # does, only pay for it then
+                if arcname in ("", "."):
+                    arcname = Path(filename).name
 
-        arcname = self._distinfo_path(section + "/" + arcname.lstrip("/"), kind="data")
+        arcname = section_dir + arcname.lstrip("/")
 
         self.write(
             filename,
@@ -2224,7 +3097,7 @@ class WheelFile:
             `ZipInfo` object, the value its `compresslevel` field is also
             overriden.
         """
-        self._check_section(section)
+        section_dir = self._section_dir(section)
 
         arcname = (
             zinfo_or_arcname.filename
@@ -2232,16 +3105,16 @@ class WheelFile:
             else zinfo_or_arcname
         )
 
-        data_arcname = self._distinfo_path(
-            section + "/" + arcname.lstrip("/"), kind="data"
-        )
+        data_arcname = section_dir + arcname.lstrip("/")
 
         if isinstance(zinfo_or_arcname, zipfile.ZipInfo):
             zinfo_or_arcname = _clone_zipinfo(zinfo_or_arcname, filename=data_arcname)
         else:
             zinfo_or_arcname = data_arcname
 
-        self.writestr(zinfo_or_arcname, data, compress_type, compresslevel)
+        self._writestr(
+            zinfo_or_arcname, data_arcname, data, compress_type, compresslevel
+        )
 
     # TODO: Lazy mode should permit writing meta here
     def write_distinfo(
@@ -2329,7 +3202,7 @@ class WheelFile:
                 f"Write would result in a duplicated metadata file: {arcname}."
             )
 
-        arcname = self._distinfo_path(arcname)
+        arcname = self._distinfo_dir + arcname
 
         self.write(
             filename,
@@ -2393,22 +3266,22 @@ class WheelFile:
         )
 
         # TODO don't check this in lazy mode
-        if (
-            arcname in self.METADATA_FILENAMES
-            or arcname.split("/")[0] in self.METADATA_FILENAMES
-        ):
+        # The first path segment is the whole arcname if it has no slashes
+        if arcname.partition("/")[0] in self.METADATA_FILENAMES:
             raise ProhibitedWriteError(
                 f"Write would result in a duplicated metadata file: {arcname}."
             )
 
-        dist_arcname = self._distinfo_path(arcname.lstrip("/"))
+        dist_arcname = self._distinfo_dir + arcname.lstrip("/")
 
         if isinstance(zinfo_or_arcname, zipfile.ZipInfo):
             zinfo_or_arcname = _clone_zipinfo(zinfo_or_arcname, filename=dist_arcname)
         else:
             zinfo_or_arcname = dist_arcname
 
-        self.writestr(zinfo_or_arcname, data, compress_type, compresslevel)
+        self._writestr(
+            zinfo_or_arcname, dist_arcname, data, compress_type, compresslevel
+        )
 
     @staticmethod
     def _check_section(section):
@@ -2424,8 +3297,9 @@ class WheelFile:
         Same as ``ZipFile.namelist()``, but omits ``RECORD``, ``METADATA``, and
         ``WHEEL`` files.
         """
-        skip = [self._distinfo_path(n) for n in self.METADATA_FILENAMES]
-        return [name for name in self.zipfile.namelist() if name not in skip]
+        skip = self._metadata_arcnames
+        # Reads filelist directly, instead of copying it via namelist() first
+        return [zi.filename for zi in self._zip.filelist if zi.filename not in skip]
 
     def infolist(self) -> List[zipfile.ZipInfo]:
         """Return a list of ``ZipInfo`` objects for each wheel member.
@@ -2433,13 +3307,29 @@ class WheelFile:
         Same as ``ZipFile.infolist()``, but omits objects corresponding to
         ``RECORD``, ``METADATA``, and ``WHEEL`` files.
         """
-        skip = [self._distinfo_path(n) for n in self.METADATA_FILENAMES]
-        return [zi for zi in self.zipfile.infolist() if zi.filename not in skip]
+        skip = self._metadata_arcnames
+        return [zi for zi in self._zip.filelist if zi.filename not in skip]
 
     @property
     def zipfile(self) -> zipfile.ZipFile:
         return self._zip
 
-    # TODO: return a handle w/ record refresh semantics
-    def open(self, path) -> IO:
-        raise NotImplementedError()
+    # TODO: return a writing handle w/ record refresh semantics
+    def open(self, path: Union[str, _ZipInfo]) -> IO[bytes]:
+        """Open a member of the wheel for reading.
+
+        Same as ``ZipFile.open(path)``. Writing handles are not supported yet,
+        since the data written through them would not be reflected in the
+        record.
+
+        Parameters
+        ----------
+        path
+            Path of the member in the archive, or its ``ZipInfo`` object.
+
+        Returns
+        -------
+        IO[bytes]
+            Binary file-like object with the decompressed contents.
+        """
+        return self._zip.open(path)